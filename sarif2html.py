@@ -4,239 +4,157 @@ SARIF to HTML Report Generator
 Converts SARIF (Static Analysis Results Interchange Format) files to interactive HTML reports
 """
 
-import json
+import os
 import sys
+import contextlib
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
 import html
+import functools
+from operator import itemgetter
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+    _loads = lambda b: json.loads(b.decode('utf-8'))
+    _dumps = lambda o: json.dumps(o).encode('utf-8')
 
-class SarifToHtmlConverter:
-    def __init__(self, sarif_file):
-        """Initialize converter with SARIF file path"""
-        self.sarif_file = Path(sarif_file)
-        self.data = None
-        self.results = []
-        self.notifications = []
-        
-    def load_sarif(self):
-        """Load and parse SARIF JSON file"""
-        try:
-            with open(self.sarif_file, 'r') as f:
-                self.data = json.load(f)
-            
-            # Extract results and notifications from first run
-            if self.data.get('runs'):
-                run = self.data['runs'][0]
-                self.results = run.get('results', [])
-                self.notifications = run.get('toolExecutionNotifications', [])
-            
-            print(f"✓ Loaded SARIF file: {self.sarif_file.name}")
-            print(f"  - {len(self.results)} results found")
-            print(f"  - {len(self.notifications)} notifications found")
-            return True
-        except Exception as e:
-            print(f"✗ Error loading SARIF file: {e}", file=sys.stderr)
-            return False
-    
-    def get_statistics(self):
-        """Calculate statistics from results"""
-        stats = {
-            'total': len(self.results),
-            'errors': 0,
-            'warnings': 0,
-            'notes': 0,
-            'files': set(),
-            'rules': set(),
-            'by_level': defaultdict(int),
-            'by_file': defaultdict(int),
-        }
-        
-        for result in self.results:
-            level = result.get('level', 'warning')
-            stats['by_level'][level] += 1
-            
-            if level == 'error':
-                stats['errors'] += 1
-            elif level == 'warning':
-                stats['warnings'] += 1
-            elif level == 'note':
-                stats['notes'] += 1
-            
-            # Collect unique files
-            if result.get('locations'):
-                uri = result['locations'][0].get('physicalLocation', {}).get('artifactLocation', {}).get('uri')
-                if uri:
-                    stats['files'].add(uri)
-                    stats['by_file'][uri] += 1
-            
-            # Collect unique rules
-            if result.get('ruleId'):
-                stats['rules'].add(result['ruleId'])
-        
-        stats['files'] = len(stats['files'])
-        stats['rules'] = len(stats['rules'])
-        
-        return stats
-    
-    def categorize_results(self):
-        """Categorize results by severity level"""
-        categorized = {'error': [], 'warning': [], 'note': []}
-        for result in self.results:
-            level = result.get('level', 'warning')
-            if level not in categorized:
-                categorized[level] = []
-            categorized[level].append(result)
-        return categorized
-    
-    def escape_html(self, text):
-        """Escape HTML special characters"""
-        if not text:
-            return ''
+
+# Shared read-only defaults for .get() chains, so missing keys allocate nothing
+_EMPTY_DICT = {}
+_EMPTY_TUPLE = ()
+_EMPTY_LOCATIONS = (_EMPTY_DICT,)
+
+
+@functools.lru_cache(maxsize=4096)
+def _esc_str(text):
+    return html.escape(text)
+
+
+def _esc(text):
+    """Escape HTML special characters, cached for repeating rule IDs, paths and tags"""
+    if not text:
+        return ''
+    if type(text) is not str:
+        # Numbers, lists and other non-str values are coerced and not cached
         return html.escape(str(text))
-    
-    def get_location_info(self, result):
-        """Extract location information from result"""
-        try:
-            location = result.get('locations', [{}])[0]
-            physical = location.get('physicalLocation', {})
-            artifact = physical.get('artifactLocation', {})
-            region = physical.get('region', {})
-            
-            return {
-                'file': artifact.get('uri', 'unknown'),
-                'start_line': region.get('startLine', '?'),
-                'start_column': region.get('startColumn', '?'),
-                'end_line': region.get('endLine', '?'),
-                'end_column': region.get('endColumn', '?'),
-                'snippet': region.get('snippet', {}).get('text', ''),
-            }
-        except:
-            return {
-                'file': 'unknown',
-                'start_line': '?',
-                'start_column': '?',
-                'end_line': '?',
-                'end_column': '?',
-                'snippet': '',
-            }
-    
-    def generate_html(self, output_file=None):
-        """Generate HTML report"""
-        if output_file is None:
-            output_file = self.sarif_file.stem + '_report.html'
-        
-        stats = self.get_statistics()
-        categorized = self.categorize_results()
-        
-        html_content = f"""<!DOCTYPE html>
+    return _esc_str(text)
+
+
+# Static head of the report; only the title is filled in
+_HEADER_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SARIF Report - {self.escape_html(self.sarif_file.name)}</title>
+    <title>SARIF Report - %s</title>
     <style>
-        * {{
+"""
+
+_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: #f5f7fa;
             color: #333;
             line-height: 1.6;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 2rem;
-        }}
+        }
 
-        header {{
+        header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 2rem;
             border-radius: 0.5rem;
             margin-bottom: 2rem;
             box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 2rem;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .report-meta {{
+        .report-meta {
             font-size: 0.9rem;
             opacity: 0.9;
             margin-top: 1rem;
             padding-top: 1rem;
             border-top: 1px solid rgba(255, 255, 255, 0.2);
-        }}
+        }
 
-        .stats-grid {{
+        .stats-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 1rem;
             margin-bottom: 2rem;
-        }}
+        }
 
-        .stat-card {{
+        .stat-card {
             background: white;
             padding: 1.5rem;
             border-radius: 0.5rem;
             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
             border-left: 4px solid #667eea;
-        }}
+        }
 
-        .stat-card.error {{
+        .stat-card.error {
             border-left-color: #e74c3c;
-        }}
+        }
 
-        .stat-card.warning {{
+        .stat-card.warning {
             border-left-color: #f39c12;
-        }}
+        }
 
-        .stat-card.note {{
+        .stat-card.note {
             border-left-color: #3498db;
-        }}
+        }
 
-        .stat-label {{
+        .stat-label {
             font-size: 0.9rem;
             color: #7f8c8d;
             text-transform: uppercase;
             letter-spacing: 0.05em;
             font-weight: 600;
-        }}
+        }
 
-        .stat-value {{
+        .stat-value {
             font-size: 2.5rem;
             font-weight: 700;
             margin-top: 0.5rem;
             color: #2c3e50;
-        }}
+        }
 
-        .stat-card.error .stat-value {{
+        .stat-card.error .stat-value {
             color: #e74c3c;
-        }}
+        }
 
-        .stat-card.warning .stat-value {{
+        .stat-card.warning .stat-value {
             color: #f39c12;
-        }}
+        }
 
-        .stat-card.note .stat-value {{
+        .stat-card.note .stat-value {
             color: #3498db;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 2rem;
-        }}
+        }
 
-        .section-title {{
+        .section-title {
             font-size: 1.5rem;
             font-weight: 700;
             margin-bottom: 1rem;
@@ -245,21 +163,21 @@ class SarifToHtmlConverter:
             display: flex;
             align-items: center;
             gap: 0.5rem;
-        }}
+        }
 
-        .section-title.error {{
+        .section-title.error {
             border-bottom-color: #e74c3c;
-        }}
+        }
 
-        .section-title.warning {{
+        .section-title.warning {
             border-bottom-color: #f39c12;
-        }}
+        }
 
-        .section-title.note {{
+        .section-title.note {
             border-bottom-color: #3498db;
-        }}
+        }
 
-        .severity-badge {{
+        .severity-badge {
             display: inline-block;
             padding: 0.25rem 0.75rem;
             border-radius: 1rem;
@@ -267,24 +185,24 @@ class SarifToHtmlConverter:
             font-weight: 600;
             text-transform: uppercase;
             letter-spacing: 0.05em;
-        }}
+        }
 
-        .severity-badge.error {{
+        .severity-badge.error {
             background: #fadbd8;
             color: #c0392b;
-        }}
+        }
 
-        .severity-badge.warning {{
+        .severity-badge.warning {
             background: #fdebd0;
             color: #b8860b;
-        }}
+        }
 
-        .severity-badge.note {{
+        .severity-badge.note {
             background: #d6eaf8;
             color: #1f618d;
-        }}
+        }
 
-        .result-item {{
+        .result-item {
             background: white;
             border: 1px solid #ecf0f1;
             border-radius: 0.5rem;
@@ -292,107 +210,107 @@ class SarifToHtmlConverter:
             overflow: hidden;
             transition: all 0.2s;
             box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        }}
+        }
 
-        .result-item:hover {{
+        .result-item:hover {
             box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
             border-color: #bdc3c7;
-        }}
+        }
 
-        .result-header {{
+        .result-header {
             padding: 1.5rem;
             border-left: 4px solid #667eea;
             background: #f9f9f9;
-        }}
+        }
 
-        .result-item.error .result-header {{
+        .result-item.error .result-header {
             border-left-color: #e74c3c;
-        }}
+        }
 
-        .result-item.warning .result-header {{
+        .result-item.warning .result-header {
             border-left-color: #f39c12;
-        }}
+        }
 
-        .result-item.note .result-header {{
+        .result-item.note .result-header {
             border-left-color: #3498db;
-        }}
+        }
 
-        .result-message {{
+        .result-message {
             font-size: 1.1rem;
             font-weight: 600;
             color: #2c3e50;
             margin-bottom: 0.75rem;
-        }}
+        }
 
-        .result-rule {{
+        .result-rule {
             font-family: 'Courier New', monospace;
             font-size: 0.85rem;
             color: #7f8c8d;
             word-break: break-all;
-        }}
+        }
 
-        .result-body {{
+        .result-body {
             padding: 1.5rem;
-        }}
+        }
 
-        .result-section {{
+        .result-section {
             margin-bottom: 1.5rem;
-        }}
+        }
 
-        .result-section:last-child {{
+        .result-section:last-child {
             margin-bottom: 0;
-        }}
+        }
 
-        .result-section-title {{
+        .result-section-title {
             font-size: 0.95rem;
             font-weight: 600;
             color: #2c3e50;
             margin-bottom: 0.5rem;
             text-transform: uppercase;
             letter-spacing: 0.03em;
-        }}
+        }
 
-        .result-section-content {{
+        .result-section-content {
             background: #f5f7fa;
             padding: 1rem;
             border-radius: 0.375rem;
             border-left: 3px solid #667eea;
-        }}
+        }
 
-        .result-item.error .result-section-content {{
+        .result-item.error .result-section-content {
             border-left-color: #e74c3c;
-        }}
+        }
 
-        .result-item.warning .result-section-content {{
+        .result-item.warning .result-section-content {
             border-left-color: #f39c12;
-        }}
+        }
 
-        .result-item.note .result-section-content {{
+        .result-item.note .result-section-content {
             border-left-color: #3498db;
-        }}
+        }
 
-        .location-info {{
+        .location-info {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 1rem;
             margin-bottom: 0.5rem;
-        }}
+        }
 
-        .location-item {{
+        .location-item {
             font-size: 0.9rem;
-        }}
+        }
 
-        .location-label {{
+        .location-label {
             font-weight: 600;
             color: #2c3e50;
-        }}
+        }
 
-        .location-value {{
+        .location-value {
             color: #7f8c8d;
             font-family: 'Courier New', monospace;
-        }}
+        }
 
-        .code-snippet {{
+        .code-snippet {
             background: #2c3e50;
             color: #ecf0f1;
             padding: 1rem;
@@ -403,32 +321,32 @@ class SarifToHtmlConverter:
             line-height: 1.5;
             white-space: pre-wrap;
             word-wrap: break-word;
-        }}
+        }
 
-        .tags {{
+        .tags {
             display: flex;
             flex-wrap: wrap;
             gap: 0.5rem;
-        }}
+        }
 
-        .tag {{
+        .tag {
             background: #ecf0f1;
             color: #2c3e50;
             padding: 0.25rem 0.75rem;
             border-radius: 0.25rem;
             font-size: 0.8rem;
             border: 1px solid #bdc3c7;
-        }}
+        }
 
-        .empty-state {{
+        .empty-state {
             background: #f9f9f9;
             padding: 2rem;
             border-radius: 0.5rem;
             text-align: center;
             color: #7f8c8d;
-        }}
+        }
 
-        .notification-item {{
+        .notification-item {
             background: #fef5e7;
             border: 1px solid #f39c12;
             border-left: 4px solid #f39c12;
@@ -436,9 +354,9 @@ class SarifToHtmlConverter:
             margin-bottom: 1rem;
             border-radius: 0.375rem;
             color: #7d6608;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 1rem;
@@ -446,83 +364,304 @@ class SarifToHtmlConverter:
             border-radius: 0.375rem;
             overflow: hidden;
             box-shadow: 0 1px 3px rgba(0, 0, 0, 0.05);
-        }}
+        }
 
-        th {{
+        th {
             background: #f5f7fa;
             padding: 1rem;
             text-align: left;
             font-weight: 600;
             color: #2c3e50;
             border-bottom: 2px solid #ecf0f1;
-        }}
+        }
 
-        td {{
+        td {
             padding: 1rem;
             border-bottom: 1px solid #ecf0f1;
-        }}
+        }
 
-        tr:last-child td {{
+        tr:last-child td {
             border-bottom: none;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background: #f9f9f9;
-        }}
+        }
 
-        .file-name {{
+        .file-name {
             font-family: 'Courier New', monospace;
             color: #667eea;
             word-break: break-all;
-        }}
+        }
 
-        footer {{
+        footer {
             margin-top: 3rem;
             padding-top: 2rem;
             border-top: 1px solid #ecf0f1;
             text-align: center;
             color: #7f8c8d;
             font-size: 0.9rem;
-        }}
+        }
 
-        @media print {{
-            body {{
+        @media print {
+            body {
                 background: white;
-            }}
+            }
             
-            .result-item {{
+            .result-item {
                 page-break-inside: avoid;
-            }}
+            }
             
-            header {{
+            header {
                 color: #2c3e50;
                 background: #f5f7fa;
                 border: 1px solid #bdc3c7;
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 1rem;
-            }}
+            }
 
-            header {{
+            header {
                 padding: 1.5rem;
-            }}
+            }
 
-            h1 {{
+            h1 {
                 font-size: 1.5rem;
-            }}
+            }
 
-            .stats-grid {{
+            .stats-grid {
                 grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            }}
+            }
 
-            .location-info {{
+            .location-info {
                 grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# Per-result HTML fragments, filled with printf-style formatting
+_LOCATION_TEMPLATE = """
+                    <div class="result-section">
+                        <div class="result-section-title">📍 Location</div>
+                        <div class="result-section-content">
+                            <div class="location-info">
+                                <div class="location-item">
+                                    <div class="location-label">File:</div>
+                                    <div class="location-value file-name">%s</div>
+                                </div>
+                                <div class="location-item">
+                                    <div class="location-label">Line:</div>
+                                    <div class="location-value">%s</div>
+                                </div>
+                                <div class="location-item">
+                                    <div class="location-label">Column:</div>
+                                    <div class="location-value">%s</div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+"""
+
+_SNIPPET_TEMPLATE = """
+                    <div class="result-section">
+                        <div class="result-section-title">💻 Code</div>
+                        <div class="code-snippet">%s</div>
+                    </div>
+"""
+
+_TAG_TEMPLATE = '                            <span class="tag">%s</span>\n'
+
+
+def _render_level(level, results, write):
+    """Write the HTML section for one severity level"""
+    esc = html.escape
+    
+    level_title = level.upper()
+    icon = '❌' if level == 'error' else '⚠️' if level == 'warning' else 'ℹ️'
+    
+    write(f"""
+        <!-- {level_title} Section -->
+        <div class="section">
+            <div class="section-title {level}">
+                {icon} {level_title}s ({len(results)})
+            </div>
+""")
+    
+    # Fold the level into the per-result template once per section
+    result_template = f"""
+            <div class="result-item {level}">
+                <div class="result-header">
+                    <div class="result-message">
+                        %s
+                    </div>
+                    <div class="result-rule">
+                        Rule: %s
+                    </div>
+                </div>
+                <div class="result-body">
+""" + _LOCATION_TEMPLATE
+    
+    for result in results:
+        get = result.get
+        try:
+            loc = (get('locations') or _EMPTY_LOCATIONS)[0]
+            phys = loc.get('physicalLocation') or _EMPTY_DICT
+            region = phys.get('region') or _EMPTY_DICT
+            uri = (phys.get('artifactLocation') or _EMPTY_DICT).get('uri', 'unknown')
+            start_line = region.get('startLine', '?')
+            start_column = region.get('startColumn', '?')
+            snippet = (region.get('snippet') or _EMPTY_DICT).get('text', '')
+        except (AttributeError, TypeError):
+            uri, start_line, start_column, snippet = 'unknown', '?', '?', ''
+        
+        rule_id = get('ruleId', 'unknown')
+        message = (get('message') or _EMPTY_DICT).get('text', '')
+        tags = (get('properties') or _EMPTY_DICT).get('tags') or _EMPTY_TUPLE
+        esc_file = _esc(uri)
+        
+        write(result_template % (
+            esc(str(message)) if message else '',
+            _esc(rule_id),
+            esc_file,
+            start_line,
+            start_column,
+        ))
+        
+        # Code snippet
+        if snippet:
+            write(_SNIPPET_TEMPLATE % esc(str(snippet)))
+        
+        # Tags
+        if tags:
+            write("""
+                    <div class="result-section">
+                        <div class="result-section-title">🏷️ Tags</div>
+                        <div class="tags">
+""")
+            for tag in tags:
+                write(_TAG_TEMPLATE % _esc(tag))
+            write("""
+                        </div>
+                    </div>
+""")
+        
+        write("""
+                </div>
+            </div>
+""")
+    
+    write("""
+        </div>
+""")
+
+
+class SarifToHtmlConverter:
+    def __init__(self, sarif_file):
+        """Initialize converter with SARIF file path"""
+        self.sarif_file = Path(sarif_file)
+        self.notifications = []
+        self.stats = None
+        self.categorized = None
+        
+    def load_sarif(self):
+        """Load SARIF file, computing statistics and categories in one pass"""
+        try:
+            with open(self.sarif_file, 'rb') as f:
+                data = _loads(f.read())
+            
+            # Extract results and notifications from first run
+            run = data['runs'][0] if data.get('runs') else _EMPTY_DICT
+            self.notifications = run.get('toolExecutionNotifications', [])
+            self.stats, self.categorized = self.get_statistics(run.get('results', []))
+            
+            print(f"✓ Loaded SARIF file: {self.sarif_file.name}")
+            print(f"  - {self.stats['total']} results found")
+            print(f"  - {len(self.notifications)} notifications found")
+            return True
+        except Exception as e:
+            print(f"✗ Error loading SARIF file: {e}", file=sys.stderr)
+            return False
+    
+    def get_statistics(self, results):
+        """Calculate statistics and categorize results by severity level"""
+        file_uris = []
+        add_file = file_uris.append
+        rule_ids_seen = set()
+        add_rule = rule_ids_seen.add
+        categorized = {'error': [], 'warning': [], 'note': []}
+        
+        for result in results:
+            result_level = result.get('level', 'warning')
+            
+            # Count issues per file
+            locations = result.get('locations')
+            if locations:
+                physical = locations[0].get('physicalLocation') or _EMPTY_DICT
+                uri = (physical.get('artifactLocation') or _EMPTY_DICT).get('uri')
+                if uri:
+                    add_file(uri)
+            
+            # Collect unique rules
+            rule_id = result.get('ruleId')
+            if rule_id:
+                add_rule(rule_id)
+            
+            categorized.setdefault(result_level, []).append(result)
+        
+        by_file = Counter(file_uris)
+        
+        # Per-level counts fall out of the severity buckets
+        stats = {
+            'total': sum(map(len, categorized.values())),
+            'errors': len(categorized['error']),
+            'warnings': len(categorized['warning']),
+            'notes': len(categorized['note']),
+            'files': len(by_file),
+            'rules': len(rule_ids_seen),
+            'by_file': by_file,
+        }
+        
+        return stats, categorized
+    
+    def generate_html(self, output_file=None):
+        """Generate HTML report"""
+        if output_file is None:
+            output_file = self.sarif_file.stem + '_report.html'
+        
+        # Stream fragments straight to disk rather than building the document,
+        # into a sibling temp file so a failed render never clobbers a report
+        output_path = Path(output_file)
+        tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            try:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    self.write_html(f.write)
+                tmp_path.replace(output_path)
+            finally:
+                # Gone already after a successful replace; removes leftovers
+                # from errors and interrupts such as KeyboardInterrupt
+                with contextlib.suppress(OSError):
+                    tmp_path.unlink()
+            print(f"✓ HTML report generated: {output_file}")
+            return output_file
+        except Exception as e:
+            print(f"✗ Error writing HTML file: {e}", file=sys.stderr)
+            return None
+    
+    def write_html(self, write):
+        """Write the HTML report as a sequence of fragments"""
+        stats = self.stats
+        categorized = self.categorized
+        
+        esc = html.escape
+        file_name_escaped = esc(self.sarif_file.name)
+        
+        write(_HEADER_PREFIX % file_name_escaped)
+        write(_CSS)
+        write(f"""    </style>
 </head>
 <body>
     <div class="container">
@@ -530,7 +669,7 @@ class SarifToHtmlConverter:
             <h1>📊 SARIF Analysis Report</h1>
             <p>Static Analysis Results Interchange Format</p>
             <div class="report-meta">
-                <p><strong>File:</strong> {self.escape_html(self.sarif_file.name)}</p>
+                <p><strong>File:</strong> {file_name_escaped}</p>
                 <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
             </div>
         </header>
@@ -562,123 +701,38 @@ class SarifToHtmlConverter:
                 <div class="stat-value">{stats['rules']}</div>
             </div>
         </div>
-"""
+""")
         
         # Add notifications section if any
         if self.notifications:
-            html_content += f"""
+            write(f"""
         <!-- Notifications Section -->
         <div class="section">
             <div class="section-title warning">
                 ⚠️ Build/Syntax Issues ({len(self.notifications)})
             </div>
             <div>
-"""
+""")
             for notif in self.notifications:
-                html_content += f"""
+                notif_text = (notif.get('message') or _EMPTY_DICT).get('text', '')
+                write(f"""
                 <div class="notification-item">
-                    {self.escape_html(notif.get('message', {}).get('text', ''))}
+                    {esc(str(notif_text)) if notif_text else ''}
                 </div>
-"""
-            html_content += """
+""")
+            write("""
             </div>
         </div>
-"""
+""")
         
         # Add results by severity
-        for level in ['error', 'warning', 'note']:
-            results_by_level = categorized.get(level, [])
-            if not results_by_level:
-                continue
-            
-            level_title = level.upper()
-            icon = '❌' if level == 'error' else '⚠️' if level == 'warning' else 'ℹ️'
-            
-            html_content += f"""
-        <!-- {level_title} Section -->
-        <div class="section">
-            <div class="section-title {level}">
-                {icon} {level_title}s ({len(results_by_level)})
-            </div>
-"""
-            
-            for idx, result in enumerate(results_by_level, 1):
-                loc_info = self.get_location_info(result)
-                rule_id = result.get('ruleId', 'unknown')
-                message = result.get('message', {}).get('text', '')
-                tags = result.get('properties', {}).get('tags', [])
-                
-                html_content += f"""
-            <div class="result-item {level}">
-                <div class="result-header">
-                    <div class="result-message">
-                        {self.escape_html(message)}
-                    </div>
-                    <div class="result-rule">
-                        Rule: {self.escape_html(rule_id)}
-                    </div>
-                </div>
-                <div class="result-body">
-"""
-                
-                # Location information
-                html_content += f"""
-                    <div class="result-section">
-                        <div class="result-section-title">📍 Location</div>
-                        <div class="result-section-content">
-                            <div class="location-info">
-                                <div class="location-item">
-                                    <div class="location-label">File:</div>
-                                    <div class="location-value file-name">{self.escape_html(loc_info['file'])}</div>
-                                </div>
-                                <div class="location-item">
-                                    <div class="location-label">Line:</div>
-                                    <div class="location-value">{loc_info['start_line']}</div>
-                                </div>
-                                <div class="location-item">
-                                    <div class="location-label">Column:</div>
-                                    <div class="location-value">{loc_info['start_column']}</div>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-"""
-                
-                # Code snippet
-                if loc_info['snippet']:
-                    html_content += f"""
-                    <div class="result-section">
-                        <div class="result-section-title">💻 Code</div>
-                        <div class="code-snippet">{self.escape_html(loc_info['snippet'])}</div>
-                    </div>
-"""
-                
-                # Tags
-                if tags:
-                    html_content += f"""
-                    <div class="result-section">
-                        <div class="result-section-title">🏷️ Tags</div>
-                        <div class="tags">
-"""
-                    for tag in tags:
-                        html_content += f'                            <span class="tag">{self.escape_html(tag)}</span>\n'
-                    html_content += """
-                        </div>
-                    </div>
-"""
-                
-                html_content += """
-                </div>
-            </div>
-"""
-            
-            html_content += """
-        </div>
-"""
+        for level in ('error', 'warning', 'note'):
+            if categorized.get(level):
+                _render_level(level, categorized[level], write)
         
         # Add file summary table
         if stats['by_file']:
-            html_content += f"""
+            write(f"""
         <!-- File Summary -->
         <div class="section">
             <div class="section-title">
@@ -692,56 +746,65 @@ class SarifToHtmlConverter:
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
             
-            for file, count in sorted(stats['by_file'].items(), key=lambda x: x[1], reverse=True):
-                html_content += f"""
+            for file, count in sorted(stats['by_file'].items(), key=itemgetter(1), reverse=True):
+                write(f"""
                     <tr>
-                        <td class="file-name">{self.escape_html(file)}</td>
+                        <td class="file-name">{_esc(file)}</td>
                         <td style="text-align: right;"><strong>{count}</strong></td>
                     </tr>
-"""
+""")
             
-            html_content += """
+            write("""
                 </tbody>
             </table>
         </div>
-"""
+""")
         
         # Footer
-        html_content += """
+        write("""
         <footer>
             <p>Generated by SARIF to HTML Converter</p>
         </footer>
     </div>
 </body>
 </html>
-"""
-        
-        # Write to file
-        try:
-            with open(output_file, 'w') as f:
-                f.write(html_content)
-            print(f"✓ HTML report generated: {output_file}")
-            return output_file
-        except Exception as e:
-            print(f"✗ Error writing HTML file: {e}", file=sys.stderr)
-            return None
+""")
 
 
 def main():
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    emit_json = '--emit-json' in args
+    if emit_json:
+        args.remove('--emit-json')
+    
+    # --emit-json prints stats instead of writing HTML, so it takes no output file
+    if not args or (emit_json and len(args) > 1):
         print("Usage: python sarif-to-html.py <sarif_file> [output_file]")
+        print("       python sarif-to-html.py --emit-json <sarif_file>")
+        print("\n  --emit-json  print report statistics as JSON to stdout; no HTML is written")
         print("\nExample:")
         print("  python sarif-to-html.py report.sarif")
         print("  python sarif-to-html.py report.sarif output_report.html")
+        print("  python sarif-to-html.py --emit-json report.sarif > stats.json")
         sys.exit(1)
     
-    sarif_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    sarif_file = args[0]
+    output_file = args[1] if len(args) > 1 else None
     
     converter = SarifToHtmlConverter(sarif_file)
     
+    if emit_json:
+        # Keep stdout machine-readable: progress goes to stderr, stats to stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            loaded = converter.load_sarif()
+        if not loaded:
+            sys.exit(1)
+        sys.stdout.buffer.write(_dumps(converter.stats))
+        sys.stdout.buffer.write(b'\n')
+        sys.exit(0)
+    
     if not converter.load_sarif():
         sys.exit(1)
     